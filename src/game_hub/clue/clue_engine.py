@@ -1,17 +1,36 @@
 import random
 import sys
+import threading
 import time
 import heapq
 from typing import List, Dict, Any, Union
 
-# Try to import crewai. If not installed, provide a dummy mock for demonstration purposes
-# so the code doesn't crash immediately if the user runs it without the library.
-try:
-    from crewai import Agent, Task, Crew, Process
-    from crewai.tools import tool
-except ImportError:
-    print("CRITICAL: 'crewai' library not found. Please install it using: pip install crewai")
-    sys.exit(1)
+# crewai is heavy, so it is only imported once the AI players are needed.
+# run_clue_game() starts prewarm_crewai() while the human is still choosing a character.
+
+def _import_crewai():
+    try:
+        import crewai
+        import crewai.tools
+    except ImportError:
+        raise ImportError("'crewai' library not found. Please install it using: pip install crewai")
+    return crewai, crewai.tools.tool
+
+def require_crewai():
+    """Raises ImportError if crewai isn't installed - lets callers fail fast before starting any LLM game."""
+    _import_crewai()
+
+def prewarm_crewai():
+    """Imports crewai in a background thread so the first AI turn doesn't pay for it."""
+    def _warm():
+        try:
+            _import_crewai()
+        except ImportError:
+            pass  # Reported properly when the game actually needs it
+
+    thread = threading.Thread(target=_warm, name="crewai-prewarm", daemon=True)
+    thread.start()
+    return thread
 
 # =================================================================================================
 # GAME ENGINE & LOGIC
@@ -74,6 +93,22 @@ class ClueGameEngine:
         return dist_map
 
     def setup_game(self, human_character_name: str):
+        # AI Players (Pick 3 random characters excluding the human's choice)
+        remaining_suspects = [s for s in self.suspects if s != human_character_name]
+        ai_names = random.sample(remaining_suspects, 3)
+
+        self._deal([human_character_name] + ai_names, human_name=human_character_name)
+
+        print(f"\n--- GAME SETUP COMPLETE ---")
+        print(f"The Game Manager has hidden the cards in the envelope.")
+        print(f"You are playing as {human_character_name}.")
+        print(f"Your opponents are: {', '.join(ai_names)}")
+
+    def setup_ai_game(self, player_names: List[str]):
+        """Sets up a game where every seat is played by an AI (used for bot-vs-bot matches). Seat order is turn order."""
+        self._deal(player_names, human_name=None)
+
+    def _deal(self, player_names: List[str], human_name: Union[str, None]):
         # 1. Select Truth
         truth_suspect = random.choice(self.suspects)
         truth_weapon = random.choice(self.weapons)
@@ -90,26 +125,10 @@ class ClueGameEngine:
 
         # 2. Setup Players
         self.players = []
-
-        # 2a. Human Player
-        self.players.append({
-            "name": human_character_name,
-            "is_ai": False,
-            "hand": [],
-            "loc": "Lounge",
-            "eliminated": False,
-            "memory": {},
-            "agent": None
-        })
-
-        # 2b. AI Players (Pick 3 random characters excluding the human's choice)
-        remaining_suspects = [s for s in self.suspects if s != human_character_name]
-        ai_names = random.sample(remaining_suspects, 3)
-
-        for name in ai_names:
+        for name in player_names:
             self.players.append({
                 "name": name,
-                "is_ai": True,
+                "is_ai": name != human_name,
                 "hand": [],
                 "loc": "Lounge",
                 "eliminated": False,
@@ -129,11 +148,6 @@ class ClueGameEngine:
 
         # Remaining cards in 'deck' are ignored/unused.
 
-        print(f"\n--- GAME SETUP COMPLETE ---")
-        print(f"The Game Manager has hidden the cards in the envelope.")
-        print(f"You are playing as {human_character_name}.")
-        print(f"Your opponents are: {', '.join(ai_names)}")
-
     def get_player_by_name(self, name: str):
         for p in self.players:
             if p["name"] == name:
@@ -266,83 +280,205 @@ class ClueGameEngine:
             p["eliminated"] = True
             return f"WRONG! {accuser_name} has been eliminated. The truth remains hidden."
 
-# Initialize Global Game Engine
-game = ClueGameEngine()
+# Global Game Engine, created on first use
+_game = None
+
+def get_game() -> ClueGameEngine:
+    global _game
+    if _game is None:
+        _game = ClueGameEngine()
+    return _game
+
+def set_game(game: ClueGameEngine):
+    """Points the CrewAI tools at `game` (e.g. a tournament match running in this process)."""
+    global _game
+    _game = game
 
 # =================================================================================================
 # CREW AI TOOLS
 # =================================================================================================
 
+def consult_notebook(player_name: str):
+    """
+    Returns the list of cards known to the player (both their own hand and cards shown by others).
+    Use this to determine which cards are safe (not the murder weapon/suspect/room).
+    """
+    p = get_game().get_player_by_name(player_name)
+    if p:
+        mem = p.get("memory", {})
+        if not mem:
+            return "Your notebook is empty."
+        lines = [f"- {card} (Source: {who})" for card, who in mem.items()]
+        return "--- CONFIDENTIAL NOTEBOOK ---\n" + "\n".join(lines)
+    return "Error: Player not found."
+
+def look_at_hand(player_name: str):
+    """Useful to see the cards currently held by the player."""
+    p = get_game().get_player_by_name(player_name)
+    if p:
+        return f"Your hand contains: {', '.join(p['hand'])}"
+    return "Error: Player not found."
+
+def get_moves(player_name: str):
+    """
+    Returns current room, the current dice roll, and list of accessible rooms within that distance.
+    The dice have already been rolled for the turn.
+    """
+    game = get_game()
+    p = game.get_player_by_name(player_name)
+    if p:
+        current = p["loc"]
+        roll = game.current_dice_roll
+        moves = game.get_reachable_rooms(current, roll)
+        return f"You are in the {current}. You rolled a {roll}. You can move to: {', '.join(moves)}."
+    return "Error"
+
+def move(player_name: str, room_name: str):
+    """Moves the player to a connected room. Must be in the list of valid moves."""
+    return get_game().move_player(player_name, room_name)
+
+def suggest(player_name: str, suspect: str, weapon: str, room: str):
+    """
+    Make a suggestion.
+    IMPORTANT: 'room' MUST be the room the player is currently in.
+    Returns the result of the suggestion (e.g., if someone showed a card).
+    """
+    game = get_game()
+    p = game.get_player_by_name(player_name)
+    if p["loc"] != room:
+        # Auto-correction for AI logic
+        return f"Invalid suggestion: You must suggest the room you are currently in ({p['loc']})."
+
+    result = game.handle_suggestion(player_name, suspect, weapon, room)
+    game.logs.append(f"{player_name} suggested {suspect}, {weapon}, {room}. Result: {result}")
+    return result
+
+def accuse(player_name: str, suspect: str, weapon: str, room: str):
+    """
+    Make a FINAL accusation.
+    Only use this if you are 100% sure of the Room, Suspect, and Weapon.
+    If you are wrong, you lose.
+    """
+    game = get_game()
+    result = game.handle_accusation(player_name, suspect, weapon, room)
+    game.logs.append(result)
+    return result
+
 class ClueTools:
+    """CrewAI-wrapped versions of the tool functions above, built on first access so crewai loads lazily."""
+    _tools = None
+
+    @classmethod
+    def load(cls):
+        if cls._tools is None:
+            _, tool = _import_crewai()
+            cls._tools = {
+                "consult_notebook": tool("Consult Notebook")(consult_notebook),
+                "look_at_hand": tool("Look at Hand")(look_at_hand),
+                "get_moves": tool("Get Current Location and Moves")(get_moves),
+                "move": tool("Move Player")(move),
+                "suggest": tool("Make Suggestion")(suggest),
+                "accuse": tool("Make Accusation")(accuse),
+            }
+        return cls._tools
 
-    @tool("Consult Notebook")
-    def consult_notebook(player_name: str):
-        """
-        Returns the list of cards known to the player (both their own hand and cards shown by others).
-        Use this to determine which cards are safe (not the murder weapon/suspect/room).
-        """
-        p = game.get_player_by_name(player_name)
-        if p:
-            mem = p.get("memory", {})
-            if not mem:
-                return "Your notebook is empty."
-            lines = [f"- {card} (Source: {who})" for card, who in mem.items()]
-            return "--- CONFIDENTIAL NOTEBOOK ---\n" + "\n".join(lines)
-        return "Error: Player not found."
-
-    @tool("Look at Hand")
-    def look_at_hand(player_name: str):
-        """Useful to see the cards currently held by the player."""
-        p = game.get_player_by_name(player_name)
-        if p:
-            return f"Your hand contains: {', '.join(p['hand'])}"
-        return "Error: Player not found."
-
-    @tool("Get Current Location and Moves")
-    def get_moves(player_name: str):
-        """
-        Returns current room, the current dice roll, and list of accessible rooms within that distance.
-        The dice have already been rolled for the turn.
-        """
-        p = game.get_player_by_name(player_name)
-        if p:
-            current = p["loc"]
-            roll = game.current_dice_roll
-            moves = game.get_reachable_rooms(current, roll)
-            return f"You are in the {current}. You rolled a {roll}. You can move to: {', '.join(moves)}."
-        return "Error"
-
-    @tool("Move Player")
-    def move(player_name: str, room_name: str):
-        """Moves the player to a connected room. Must be in the list of valid moves."""
-        return game.move_player(player_name, room_name)
-
-    @tool("Make Suggestion")
-    def suggest(player_name: str, suspect: str, weapon: str, room: str):
-        """
-        Make a suggestion.
-        IMPORTANT: 'room' MUST be the room the player is currently in.
-        Returns the result of the suggestion (e.g., if someone showed a card).
-        """
-        p = game.get_player_by_name(player_name)
-        if p["loc"] != room:
-            # Auto-correction for AI logic
-            return f"Invalid suggestion: You must suggest the room you are currently in ({p['loc']})."
-
-        result = game.handle_suggestion(player_name, suspect, weapon, room)
-        game.logs.append(f"{player_name} suggested {suspect}, {weapon}, {room}. Result: {result}")
-        return result
-
-    @tool("Make Accusation")
-    def accuse(player_name: str, suspect: str, weapon: str, room: str):
-        """
-        Make a FINAL accusation.
-        Only use this if you are 100% sure of the Room, Suspect, and Weapon.
-        If you are wrong, you lose.
-        """
-        result = game.handle_accusation(player_name, suspect, weapon, room)
-        game.logs.append(result)
-        return result
+# =================================================================================================
+# AI PLAYERS
+# =================================================================================================
+
+def create_ai_agent(game: ClueGameEngine, player_name: str):
+    crewai, _ = _import_crewai()
+    clue_tools = ClueTools.load()
+
+    # Helper to stringify lists for prompts
+    valid_suspects_str = ", ".join(game.suspects)
+    valid_weapons_str = ", ".join(game.weapons)
+    valid_rooms_str = ", ".join(game.rooms)
+
+    return crewai.Agent(
+        role=f"{player_name} (Clue Player)",
+        goal="Deduce the Murderer, Weapon, and Room before anyone else.",
+        backstory=(
+            f"You are {player_name}. You are playing Clue. "
+            "You are competitive and smart. "
+            "You maintain a detailed Notebook of all cards you have seen. "
+            "You NEVER guess a card that is already in your Notebook. "
+            "You try to narrow down the possibilities.\n"
+            "IMPORTANT: You must ONLY use the following terms. Do not use synonyms (e.g. use 'Dagger' not 'Knife').\n"
+            f"Valid Suspects: {valid_suspects_str}\n"
+            f"Valid Weapons: {valid_weapons_str}\n"
+            f"Valid Rooms: {valid_rooms_str}"
+        ),
+        tools=[
+            clue_tools["consult_notebook"],
+            clue_tools["get_moves"],
+            clue_tools["move"],
+            clue_tools["suggest"],
+            clue_tools["accuse"]
+        ],
+        verbose=True,
+        allow_delegation=False,
+        llm="gpt-4o-mini" # Or any other available model
+    )
+
+def random_turn(game: ClueGameEngine, player: Dict[str, Any], roll: int):
+    """Simple AI move: go to a random reachable room and suggest a random suspect and weapon there."""
+    moves = game.get_reachable_rooms(player["loc"], roll)
+    if moves:
+        dest = random.choice(moves)
+        move_result = game.move_player(player["name"], dest)
+        print(move_result)
+        s_suspect = random.choice(game.suspects)
+        s_weapon = random.choice(game.weapons)
+        game.handle_suggestion(player["name"], s_suspect, s_weapon, dest)
+    else:
+        print("No moves possible.")
+
+def crew_turn(game: ClueGameEngine, player: Dict[str, Any], roll: int, fallback: bool = True):
+    """
+    LLM turn played by the player's CrewAI agent. The tools act on the global game, see set_game().
+    If the LLM fails, plays a random move when `fallback` is set, otherwise re-raises the error.
+    """
+    crewai, _ = _import_crewai()
+    if player["agent"] is None:
+        player["agent"] = create_ai_agent(game, player["name"])
+    agent = player["agent"]
+
+    # We construct a specific task for the turn to ensure it follows game rules
+    turn_description = (
+        f"It is your turn, {player['name']}. "
+        f"1. Check your known cards using 'Consult Notebook'. "
+        f"2. You rolled a {roll}. Check your moves using 'Get Current Location'. "
+        f"3. If you have valid moves, use 'Move Player' to go to a new room. If NO moves are listed, stay put. "
+        f"4. If you are in a room (even if you didn't move), make a 'Make Suggestion' about a Suspect and Weapon in that room. "
+        f"   (Do NOT suggest cards that appear in your Notebook!). "
+        f"5. If you are ABSOLUTELY CERTAIN (your Notebook eliminates almost all possibilities), use 'Make Accusation'. "
+        f"   OTHERWISE, stop. Your turn ends after the suggestion."
+    )
+
+    task = crewai.Task(
+        description=turn_description,
+        agent=agent,
+        expected_output="A summary of the actions taken (Move, Suggestion, and Result)."
+    )
+
+    # Create a mini-crew for this single turn to execute it
+    turn_crew = crewai.Crew(
+        agents=[agent],
+        tasks=[task],
+        verbose=False
+    )
+
+    try:
+        turn_crew.kickoff()
+        print(f"AI Thought Process Complete.")
+    except Exception as e:
+        print(f"AI Error: {e}")
+        if not fallback:
+            raise
+        # Fallback simple AI move if LLM fails
+        print("(Fallback) Playing a random move.")
+        random_turn(game, player, roll)
 
 # =================================================================================================
 # MAIN EXECUTION
@@ -350,6 +486,8 @@ class ClueTools:
 
 def run_clue_game():
     print("Welcome to Clue AI!")
+    prewarm_crewai()
+    game = get_game()
 
     # Select Character
     print("\n--- CHARACTER SELECTION ---")
@@ -367,49 +505,20 @@ def run_clue_game():
 
     game.setup_game(human_name)
 
-    # --- Create Agents ---
-
-    # Common configuration for agents
-    agents_map = {}
-
-    # Helper to stringify lists for prompts
-    valid_suspects_str = ", ".join(game.suspects)
-    valid_weapons_str = ", ".join(game.weapons)
-    valid_rooms_str = ", ".join(game.rooms)
+    try:
+        crewai, _ = _import_crewai()
+        ClueTools.load()
+    except ImportError as e:
+        print(f"CRITICAL: {e}")
+        sys.exit(1)
 
+    # --- Create Agents ---
     for p in game.players:
         if p["is_ai"]:
-            # Backstory generation based on logs
-            agent = Agent(
-                role=f"{p['name']} (Clue Player)",
-                goal="Deduce the Murderer, Weapon, and Room before anyone else.",
-                backstory=(
-                    f"You are {p['name']}. You are playing Clue. "
-                    "You are competitive and smart. "
-                    "You maintain a detailed Notebook of all cards you have seen. "
-                    "You NEVER guess a card that is already in your Notebook. "
-                    "You try to narrow down the possibilities.\n"
-                    "IMPORTANT: You must ONLY use the following terms. Do not use synonyms (e.g. use 'Dagger' not 'Knife').\n"
-                    f"Valid Suspects: {valid_suspects_str}\n"
-                    f"Valid Weapons: {valid_weapons_str}\n"
-                    f"Valid Rooms: {valid_rooms_str}"
-                ),
-                tools=[
-                    ClueTools.consult_notebook,
-                    ClueTools.get_moves,
-                    ClueTools.move,
-                    ClueTools.suggest,
-                    ClueTools.accuse
-                ],
-                verbose=True,
-                allow_delegation=False,
-                llm="gpt-4o-mini" # Or any other available model
-            )
-            p["agent"] = agent
-            agents_map[p["name"]] = agent
+            p["agent"] = create_ai_agent(game, p["name"])
 
     # Manager Agent (Optional, mostly for flavor in this architecture)
-    manager = Agent(
+    manager = crewai.Agent(
         role="Game Manager",
         goal="Ensure the game flows smoothly.",
         backstory="I am the mansion's butler. I know the truth, but I will never tell.",
@@ -441,49 +550,7 @@ def run_clue_game():
 
         if current_player["is_ai"]:
             # AI TURN LOGIC
-            agent = current_player["agent"]
-
-            # We construct a specific task for the turn to ensure it follows game rules
-            turn_description = (
-                f"It is your turn, {current_player['name']}. "
-                f"1. Check your known cards using 'Consult Notebook'. "
-                f"2. You rolled a {roll}. Check your moves using 'Get Current Location'. "
-                f"3. If you have valid moves, use 'Move Player' to go to a new room. If NO moves are listed, stay put. "
-                f"4. If you are in a room (even if you didn't move), make a 'Make Suggestion' about a Suspect and Weapon in that room. "
-                f"   (Do NOT suggest cards that appear in your Notebook!). "
-                f"5. If you are ABSOLUTELY CERTAIN (your Notebook eliminates almost all possibilities), use 'Make Accusation'. "
-                f"   OTHERWISE, stop. Your turn ends after the suggestion."
-            )
-
-            task = Task(
-                description=turn_description,
-                agent=agent,
-                expected_output="A summary of the actions taken (Move, Suggestion, and Result)."
-            )
-
-            # Create a mini-crew for this single turn to execute it
-            turn_crew = Crew(
-                agents=[agent],
-                tasks=[task],
-                verbose=False
-            )
-
-            try:
-                result = turn_crew.kickoff()
-                print(f"AI Thought Process Complete.")
-            except Exception as e:
-                print(f"AI Error: {e}")
-                # Fallback simple AI move if LLM fails
-                moves = game.get_reachable_rooms(current_player["loc"], roll)
-                if moves:
-                    dest = random.choice(moves)
-                    move_result = game.move_player(current_player["name"], dest)
-                    print(f"(Fallback) {move_result}")
-                    s_suspect = random.choice(game.suspects)
-                    s_weapon = random.choice(game.weapons)
-                    game.handle_suggestion(current_player["name"], s_suspect, s_weapon, dest)
-                else:
-                    print("(Fallback) No moves possible.")
+            crew_turn(game, current_player, roll)
 
         else:
             # HUMAN TURN LOGIC
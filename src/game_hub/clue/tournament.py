@@ -0,0 +1,337 @@
+"""
+Bot-vs-bot Clue tournament: every pair of policies plays until a sequential probability ratio test (SPRT)
+says one is stronger (or that they're about even), or until max_games is reached.
+Games run in parallel worker processes and every result is appended to a JSONL file as soon as it finishes,
+so an interrupted run picks up where it left off.
+
+Usage (from src/):
+    python -m game_hub.clue.tournament random heuristic crew --out clue_tournament.jsonl --workers 4
+"""
+import argparse
+import contextlib
+import functools
+import io
+import itertools
+import json
+import math
+import os
+import random
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+from typing import Dict, Any
+
+from game_hub.clue import clue_engine
+from game_hub.clue.clue_engine import ClueGameEngine, random_turn, crew_turn, require_crewai
+
+SEATS = 4
+MAX_TURNS = 200
+MAX_GAMES = 400
+ELO_START = 1500
+ELO_K = 16
+SPRT_ELO = 100  # Smallest strength gap worth detecting
+SPRT_ALPHA = 0.05
+SPRT_BETA = 0.05
+MAX_CONSECUTIVE_ERRORS = 5  # A pairing that fails this many games in a row is closed
+HEURISTIC_GUESS_COMBINATIONS = 4
+HEURISTIC_STALE_TURNS = 3
+
+# =================================================================================================
+# POLICIES
+# =================================================================================================
+
+def heuristic_turn(game: ClueGameEngine, player: Dict[str, Any], roll: int):
+    """
+    Notebook-driven AI: chases rooms and cards it hasn't seen yet.
+    Accuses when only one combination is left, or takes its best guess once the notebook stops growing -
+    undealt cards are never shown to anyone, so the notebook can't always get down to a single combination.
+    """
+    known = player["memory"]
+    unknown_suspects = [c for c in game.suspects if c not in known]
+    unknown_weapons = [c for c in game.weapons if c not in known]
+    unknown_rooms = [c for c in game.rooms if c not in known]
+
+    stale_turns = player.get("stale_turns", 0) + 1 if len(known) == player.get("known_count") else 0
+    player["stale_turns"], player["known_count"] = stale_turns, len(known)
+
+    combinations = len(unknown_suspects) * len(unknown_weapons) * len(unknown_rooms)
+    if combinations == 1 or (combinations <= HEURISTIC_GUESS_COMBINATIONS and stale_turns >= HEURISTIC_STALE_TURNS):
+        game.handle_accusation(
+            player["name"], random.choice(unknown_suspects), random.choice(unknown_weapons), random.choice(unknown_rooms)
+        )
+        return
+
+    moves = game.get_reachable_rooms(player["loc"], roll)
+    target_rooms = [r for r in moves if r in unknown_rooms]
+    if target_rooms:
+        game.move_player(player["name"], random.choice(target_rooms))
+    elif moves and player["loc"] not in unknown_rooms:
+        game.move_player(player["name"], random.choice(moves))
+
+    game.handle_suggestion(
+        player["name"],
+        random.choice(unknown_suspects or game.suspects),
+        random.choice(unknown_weapons or game.weapons),
+        player["loc"]
+    )
+
+POLICIES = {
+    "random": random_turn,
+    "heuristic": heuristic_turn,
+    # No random fallback - a failed LLM turn must surface as a match error, not be scored as a crew game
+    "crew": functools.partial(crew_turn, fallback=False),
+}
+
+# Checked before the tournament starts, so a policy that can't run fails fast instead of burning game slots
+POLICY_REQUIREMENTS = {
+    "crew": require_crewai,
+}
+
+# =================================================================================================
+# MATCHES
+# =================================================================================================
+
+def game_seed(base_seed: int, a: str, b: str, game_index: int) -> int:
+    return random.Random(f"{base_seed}:{a}:{b}:{game_index}").getrandbits(32)
+
+def seat_policies(a: str, b: str, game_index: int):
+    """Alternates policies around the table and flips who moves first every game."""
+    first, second = (a, b) if game_index % 2 == 0 else (b, a)
+    return [first if seat % 2 == 0 else second for seat in range(SEATS)]
+
+def play_match(seats, seed: int, max_turns: int = MAX_TURNS) -> Dict[str, Any]:
+    """Plays one all-AI game. `seats` lists a policy name per seat, in turn order. Returns the winning policy or None."""
+    random.seed(seed)
+    game = ClueGameEngine()
+    clue_engine.set_game(game)
+
+    names = random.sample(game.suspects, len(seats))
+    game.setup_ai_game(names)
+    policy_by_name = dict(zip(names, seats))
+
+    turns = 0
+    while not game.game_over and turns < max_turns:
+        if all(p["eliminated"] for p in game.players):
+            break
+
+        player = game.players[game.turn_index]
+        if not player["eliminated"]:
+            roll = game.start_turn()
+            POLICIES[policy_by_name[player["name"]]](game, player, roll)
+            turns += 1
+
+        game.turn_index = (game.turn_index + 1) % len(game.players)
+
+    return {"winner": policy_by_name.get(game.winner), "turns": turns}
+
+def _play_match_quietly(seats, seed: int, max_turns: int) -> Dict[str, Any]:
+    # Worker entry point - the engine and agents print a lot, keep the tournament output readable
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            return play_match(seats, seed, max_turns)
+    except Exception as e:
+        return {"winner": None, "turns": 0, "error": f"{type(e).__name__}: {e}"}
+
+# =================================================================================================
+# RATINGS & STOPPING RULE
+# =================================================================================================
+
+def update_elo(ratings: Dict[str, float], a: str, b: str, score_a: float, k: float = ELO_K):
+    expected_a = 1 / (1 + 10 ** ((ratings[b] - ratings[a]) / 400))
+    ratings[a] += k * (score_a - expected_a)
+    ratings[b] -= k * (score_a - expected_a)
+
+class SPRT:
+    """
+    Two one-sided SPRTs on the score of A against B: "A is better by elo" and "B is better by elo".
+    Draws count as half a win. Stops when either side is accepted, or when both are rejected (about even).
+    """
+
+    def __init__(self, elo: float = SPRT_ELO, alpha: float = SPRT_ALPHA, beta: float = SPRT_BETA):
+        p1 = 1 / (1 + 10 ** (-elo / 400))
+        self.log_win = math.log(p1 / 0.5)
+        self.log_loss = math.log((1 - p1) / 0.5)
+        self.upper = math.log((1 - beta) / alpha)
+        self.lower = math.log(beta / (1 - alpha))
+        self.llr_a = 0.0
+        self.llr_b = 0.0
+
+    def update(self, score_a: float):
+        self.llr_a += score_a * self.log_win + (1 - score_a) * self.log_loss
+        self.llr_b += (1 - score_a) * self.log_win + score_a * self.log_loss
+
+    def verdict(self):
+        """Returns 'a', 'b', 'even' or None while undecided."""
+        if self.llr_a >= self.upper:
+            return "a"
+        if self.llr_b >= self.upper:
+            return "b"
+        if self.llr_a <= self.lower and self.llr_b <= self.lower:
+            return "even"
+        return None
+
+# =================================================================================================
+# TOURNAMENT
+# =================================================================================================
+
+class Tournament:
+    def __init__(self, policies, out_path: str, workers: int = os.cpu_count() or 1, max_games: int = MAX_GAMES,
+                 max_turns: int = MAX_TURNS, seed: int = 0, sprt_elo: float = SPRT_ELO,
+                 alpha: float = SPRT_ALPHA, beta: float = SPRT_BETA):
+        unknown = [p for p in policies if p not in POLICIES]
+        if unknown:
+            raise ValueError(f"Unknown policies: {', '.join(unknown)}. Valid options: {', '.join(POLICIES)}")
+
+        self.out_path = out_path
+        self.workers = workers
+        self.max_games = max_games
+        self.max_turns = max_turns
+        self.seed = seed
+
+        for policy in policies:
+            if policy in POLICY_REQUIREMENTS:
+                POLICY_REQUIREMENTS[policy]()
+
+        self.pairings = list(itertools.combinations(policies, 2))
+        self.ratings = {p: float(ELO_START) for p in policies}
+        self.sprt = {pairing: SPRT(sprt_elo, alpha, beta) for pairing in self.pairings}
+        self.scores = {pairing: [0.0, 0] for pairing in self.pairings}  # [points for a, games counted]
+        # Game indices that finished without error, and ones currently running. Errored games are retried.
+        self.completed = {pairing: set() for pairing in self.pairings}
+        self.in_flight = {pairing: set() for pairing in self.pairings}
+        self.consecutive_errors = {pairing: 0 for pairing in self.pairings}
+        self.last_error = {pairing: None for pairing in self.pairings}
+        self._turn = 0
+
+    def _record(self, result: Dict[str, Any]):
+        pairing = (result["a"], result["b"])
+        self.in_flight[pairing].discard(result["game"])
+        if result.get("error"):
+            self.consecutive_errors[pairing] += 1
+            self.last_error[pairing] = result["error"]
+            return
+        if result["game"] in self.completed[pairing]:
+            return
+        self.completed[pairing].add(result["game"])
+        self.consecutive_errors[pairing] = 0
+
+        score_a = 1.0 if result["winner"] == result["a"] else 0.0 if result["winner"] == result["b"] else 0.5
+        update_elo(self.ratings, result["a"], result["b"], score_a)
+        self.scores[pairing][0] += score_a
+        self.scores[pairing][1] += 1
+        # Games still in flight when a pairing is decided count for Elo, but don't move the decision
+        if self.sprt[pairing].verdict() is None:
+            self.sprt[pairing].update(score_a)
+
+    def _resume(self):
+        if not os.path.exists(self.out_path):
+            return 0
+        replayed = 0
+        with open(self.out_path, "r", encoding="utf-8") as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                result = json.loads(line)
+                pairing = (result["a"], result["b"])
+                # Failed games are retried, so they don't count towards the resume point
+                if pairing in self.sprt and not result.get("error"):
+                    self._record(result)
+                    replayed += 1
+        return replayed
+
+    def _has_failed(self, pairing) -> bool:
+        return self.consecutive_errors[pairing] >= MAX_CONSECUTIVE_ERRORS
+
+    def _is_open(self, pairing) -> bool:
+        started = len(self.completed[pairing]) + len(self.in_flight[pairing])
+        return self.sprt[pairing].verdict() is None and not self._has_failed(pairing) and started < self.max_games
+
+    def _next_job(self):
+        # Round-robin over the pairings that still need games
+        for _ in range(len(self.pairings)):
+            pairing = self.pairings[self._turn % len(self.pairings)]
+            self._turn += 1
+            if self._is_open(pairing):
+                # Lowest index not played yet - fills gaps left by failed games or an interrupted run
+                game_index = 0
+                while game_index in self.completed[pairing] or game_index in self.in_flight[pairing]:
+                    game_index += 1
+                self.in_flight[pairing].add(game_index)
+                return pairing, game_index
+        return None
+
+    def run(self):
+        replayed = self._resume()
+        if replayed:
+            print(f"Resumed {replayed} games from {self.out_path}")
+
+        with ProcessPoolExecutor(max_workers=self.workers) as pool, open(self.out_path, "a", encoding="utf-8") as out:
+            pending = {}
+
+            def fill():
+                while len(pending) < self.workers:
+                    job = self._next_job()
+                    if job is None:
+                        return
+                    (a, b), game_index = job
+                    seats = seat_policies(a, b, game_index)
+                    seed = game_seed(self.seed, a, b, game_index)
+                    future = pool.submit(_play_match_quietly, seats, seed, self.max_turns)
+                    pending[future] = {"a": a, "b": b, "game": game_index, "seed": seed, "seats": seats}
+
+            fill()
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    result = {**pending.pop(future), **future.result()}
+                    out.write(json.dumps(result) + "\n")
+                    out.flush()
+
+                    pairing = (result["a"], result["b"])
+                    was_open = self.sprt[pairing].verdict() is None and not self._has_failed(pairing)
+                    self._record(result)
+                    if result.get("error"):
+                        print(f"{result['a']} vs {result['b']} game {result['game']} failed: {result['error']}")
+                        if was_open and self._has_failed(pairing):
+                            print(f"{result['a']} vs {result['b']} closed after {MAX_CONSECUTIVE_ERRORS} failed games in a row")
+                    elif was_open and self.sprt[pairing].verdict() is not None:
+                        print(f"{result['a']} vs {result['b']} decided: {self._describe(pairing)}")
+                fill()
+
+        return self.summary()
+
+    def _describe(self, pairing) -> str:
+        points, games = self.scores[pairing]
+        if self._has_failed(pairing):
+            return f"failed after {games} games, last error: {self.last_error[pairing]}"
+        verdict = self.sprt[pairing].verdict()
+        label = {"a": f"{pairing[0]} is stronger", "b": f"{pairing[1]} is stronger", "even": "about even"}.get(verdict, "undecided")
+        return f"{label} ({points:g}/{games} for {pairing[0]})"
+
+    def summary(self) -> Dict[str, Any]:
+        return {
+            "ratings": {p: round(r, 1) for p, r in sorted(self.ratings.items(), key=lambda item: -item[1])},
+            "pairings": {f"{a} vs {b}": self._describe((a, b)) for a, b in self.pairings},
+        }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Run a Clue AI policy tournament.")
+    parser.add_argument("policies", nargs="+", choices=list(POLICIES))
+    parser.add_argument("--out", default="clue_tournament.jsonl", help="JSONL results file, reused to resume")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--max-games", type=int, default=MAX_GAMES, help="Per pairing, if the SPRT doesn't stop earlier")
+    parser.add_argument("--max-turns", type=int, default=MAX_TURNS, help="Games longer than this are a draw")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--sprt-elo", type=float, default=SPRT_ELO)
+    args = parser.parse_args()
+
+    if len(set(args.policies)) < 2:
+        parser.error("At least two different policies are needed.")
+
+    try:
+        tournament = Tournament(
+            list(dict.fromkeys(args.policies)), args.out, workers=args.workers, max_games=args.max_games,
+            max_turns=args.max_turns, seed=args.seed, sprt_elo=args.sprt_elo
+        )
+    except ImportError as e:
+        parser.exit(1, f"CRITICAL: {e}\n")
+    print(json.dumps(tournament.run(), indent=2))
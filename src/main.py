@@ -1,4 +1,5 @@
 import random
+import uuid
 
 import streamlit as st
 import time
@@ -6,6 +7,11 @@ import time
 from resume_agent import RonnykAgent
 from tools.agents_tools import display_agent_answer
 from tools.custom_tools import set_custom_background
+from tools.model_scheduler import SchedulerBusy
+from tools.prewarm import start_prewarm
+
+# Warm heavy imports and the parsed resume in the background, the agent itself is created on the first question
+start_prewarm(tasks=[RonnykAgent().create_resume_agent_instructions])
 
 st.set_page_config(
     page_title="Ronny Kraitman",
@@ -20,13 +26,14 @@ if "messages_history" not in st.session_state:
 if "messages" not in st.session_state:
     st.session_state.messages = []
 
+if "session_id" not in st.session_state:
+    st.session_state.session_id = uuid.uuid4().hex
+
 if "headline" not in st.session_state:
     st.session_state.headline = False
 
 if "ronnyk_agent" not in st.session_state:
-    ronnyk_agent: RonnykAgent = RonnykAgent()
-    ronnyk_agent.create_an_agent()
-    st.session_state.ronnyk_agent = ronnyk_agent
+    st.session_state.ronnyk_agent = RonnykAgent()
 
 user_avatar_options = [
     "media/avatar_1.png",
@@ -86,7 +93,14 @@ if __name__ == "__main__":
                 with st.chat_message("user", avatar=st.session_state.user_avatar):
                     st.markdown(prompt)
 
-                agent_response = st.session_state.ronnyk_agent.chat(prompt)
+                try:
+                    agent_response = st.session_state.ronnyk_agent.chat(prompt, st.session_state.session_id)
+                except SchedulerBusy:
+                    st.session_state.messages.pop()
+                    with st.chat_message("assistant", avatar=ronnyk_avatar):
+                        st.warning("I'm chatting with a lot of visitors right now 😅 Give me a few seconds and ask again!")
+                    st.stop()
+
                 st.session_state.messages.append({"role": "assistant", "content": agent_response})
 
                 with st.chat_message("assistant", avatar=ronnyk_avatar):
@@ -1,13 +1,15 @@
 import asyncio
-
-from dotenv import load_dotenv
-from agents import Agent, Runner, trace
+import hashlib
 
 from tools.custom_tools import get_full_resume, get_resume_summary
 
 from tools.agents_tools import open_pdf_in_new_tab
+from tools.env import load_env
+from tools.model_scheduler import model_scheduler
+from tools.prompt_filter import prompt_filter
+from tools.shared_cache import shared_cache
 
-load_dotenv(override=True)
+OPENING_ANSWER_TTL_SECONDS = 24 * 60 * 60
 
 class RonnykAgent:
     def __init__(self):
@@ -46,15 +48,45 @@ class RonnykAgent:
 
 
     def create_an_agent(self):
+        # agents is heavy - imported here so loading this module stays cheap (see tools/prewarm.py)
+        from agents import Agent, function_tool
+
+        load_env()
         print("creating ai agent", flush=True)
         self.create_resume_agent_instructions()
-        self.agent = Agent(name=self.name, instructions=self.instructions, model=self.model_name, tools=[open_pdf_in_new_tab])
+        self.agent = Agent(name=self.name, instructions=self.instructions, model=self.model_name, tools=[function_tool(open_pdf_in_new_tab)])
+
+    def chat(self, user_input, session_id=None):
+        messages = self.history + [{"role": "user", "content": user_input}]
+        refusal = prompt_filter.check(user_input)
+        if refusal is not None:
+            self.history = messages + [{"role": "assistant", "content": refusal}]
+            return refusal
+
+        from agents import trace
+
+        if self.agent is None:
+            self.create_an_agent()
 
-    def chat(self, user_input):
         with trace("User Question"):
-            self.history.append({"role": "user", "content": user_input})
-            messages = self.history.copy()
-            result = asyncio.run(Runner.run(self.agent, messages))
-            self.history.append({"role": "assistant", "content": result.final_output})
-            return result.final_output
+            if self.history:
+                answer = model_scheduler.submit(session_id, lambda: self._run(messages))
+            else:
+                # Opening questions carry no per-session context, so every session and worker can share the answer
+                key = self._opening_question_key(user_input)
+                answer = shared_cache.get(key)
+                if answer is None:
+                    answer = model_scheduler.submit(session_id, lambda: self._run(messages), key=key)
+                    shared_cache.set(key, answer, ttl=OPENING_ANSWER_TTL_SECONDS)
+            self.history = messages + [{"role": "assistant", "content": answer}]
+            return answer
+
+    def _run(self, messages):
+        from agents import Runner
+
+        return asyncio.run(Runner.run(self.agent, messages)).final_output
 
+    def _opening_question_key(self, user_input):
+        instructions_digest = hashlib.sha256(self.instructions.encode()).hexdigest()[:16]
+        question = " ".join(user_input.lower().split())
+        return f"answer:{self.model_name}:{instructions_digest}:{question}"
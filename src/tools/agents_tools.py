@@ -1,6 +1,5 @@
 import streamlit as st
 import time
-from agents import function_tool
 
 def display_agent_answer(response_text):
     full_response = ""
@@ -12,7 +11,6 @@ def display_agent_answer(response_text):
 
     message_placeholder.markdown(f'<div style="text-align:left;"><div class="assistant-msg">{full_response}</div></div>', unsafe_allow_html=True)
 
-@function_tool
 def open_pdf_in_new_tab():
     """Return a command telling the UI to open a PDF in a new browser tab if the user asked to see or download the resume / cv"""
     return {
@@ -1,11 +1,20 @@
 import base64
+import os
 import streamlit as st
-from pypdf import PdfReader
 
-def set_custom_background(image_file):
+from tools.shared_cache import shared_cache
+
+def _file_cache_key(kind, path):
+    # mtime in the key so an updated file is picked up without flushing the cache
+    return f"{kind}:{os.path.abspath(path)}:{os.path.getmtime(path)}"
+
+def _encode_image(image_file):
     with open(image_file, "rb") as f:
         data = f.read()
-        encoded = base64.b64encode(data).decode()
+        return base64.b64encode(data).decode()
+
+def set_custom_background(image_file):
+    encoded = shared_cache.get_or_set(_file_cache_key("background", image_file), lambda: _encode_image(image_file))
     background_css = f"""
     <style>
     .stApp {{
@@ -25,6 +34,11 @@ def get_resume_summary(path):
         return summary
 
 def get_full_resume(path):
+    return shared_cache.get_or_set(_file_cache_key("resume", path), lambda: _read_pdf_text(path))
+
+def _read_pdf_text(path):
+    from pypdf import PdfReader
+
     reader = PdfReader(path)
     resume = ""
     for page in reader.pages:
@@ -0,0 +1,17 @@
+import threading
+
+_loaded = False
+_lock = threading.Lock()
+
+
+def load_env():
+    """Loads .env into os.environ once per process. Call it before reading any setting from the environment."""
+    global _loaded
+    with _lock:
+        if _loaded:
+            return
+        # dotenv is imported here rather than at module level to keep startup imports light (see tools/prewarm.py)
+        from dotenv import load_dotenv
+
+        load_dotenv(override=True)
+        _loaded = True
@@ -0,0 +1,47 @@
+"""
+Startup import report based on `python -X importtime`.
+
+Usage (from src/):
+    python -m tools.import_report resume_agent tools.custom_tools game_hub.clue.clue_engine
+"""
+import subprocess
+import sys
+
+TOP_N = 15
+
+
+def measure_imports(module):
+    """Imports `module` in a fresh interpreter and returns [(cumulative_us, self_us, name)] sorted slowest first."""
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True, text=True
+    )
+    if proc.returncode != 0:
+        raise RuntimeError(f"Importing {module} failed:\n{proc.stderr.strip().splitlines()[-1]}")
+
+    rows = []
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        rows.append((int(cumulative_us), int(self_us), name.rstrip()))
+    return sorted(rows, reverse=True)
+
+
+def print_report(module, top_n=TOP_N):
+    try:
+        rows = measure_imports(module)
+    except RuntimeError as e:
+        print(f"\n## {module}\n{e}")
+        return
+
+    total_us = next((cumulative for cumulative, _, name in rows if name.strip() == module), 0)
+    print(f"\n## {module} - {total_us / 1000:.1f} ms total, {len(rows)} modules")
+    print(f"{'cumulative ms':>14} {'self ms':>9}  module")
+    for cumulative_us, self_us, name in rows[:top_n]:
+        print(f"{cumulative_us / 1000:>14.1f} {self_us / 1000:>9.1f}  {name}")
+
+
+if __name__ == "__main__":
+    for module_name in sys.argv[1:] or ["resume_agent", "tools.custom_tools", "game_hub.clue.clue_engine"]:
+        print_report(module_name)
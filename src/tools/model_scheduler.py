@@ -0,0 +1,160 @@
+import threading
+import time
+from collections import OrderedDict, deque
+from concurrent.futures import Future
+
+MAX_CONCURRENT_CALLS = 4
+MAX_QUEUE_DEPTH = 32
+QUEUE_TIMEOUT_SECONDS = 30.0
+WAIT_SAMPLES = 1000
+LOG_STATS_EVERY_N_CALLS = 50
+
+
+class SchedulerBusy(Exception):
+    """Raised when a model call cannot get a slot - the UI should show a busy state."""
+
+
+class _Ticket:
+    __slots__ = ("session_id", "enqueued_at", "granted")
+
+    def __init__(self, session_id):
+        self.session_id = session_id
+        self.enqueued_at = time.monotonic()
+        self.granted = threading.Event()
+
+
+class ModelCallScheduler:
+    """
+    Process-wide gate in front of the model.
+    Identical in-flight calls (same key) are coalesced into one, at most `max_concurrent` calls run at once,
+    and waiting calls are served round-robin across sessions so one chatty session can't starve the others.
+    """
+
+    def __init__(self, max_concurrent=MAX_CONCURRENT_CALLS, max_queue_depth=MAX_QUEUE_DEPTH,
+                 queue_timeout=QUEUE_TIMEOUT_SECONDS):
+        self.max_concurrent = max_concurrent
+        self.max_queue_depth = max_queue_depth
+        self.queue_timeout = queue_timeout
+
+        self._lock = threading.Lock()
+        self._queues = OrderedDict()  # session_id -> deque of tickets, front session is served next
+        self._queue_depth = 0
+        self._active = 0
+        self._in_flight = {}  # coalesce key -> Future shared by all callers asking the same thing
+
+        self._calls = 0
+        self._coalesced = 0
+        self._rejected = 0
+        self._peak_queue_depth = 0
+        self._wait_times = deque(maxlen=WAIT_SAMPLES)
+
+    def submit(self, session_id, call, key=None):
+        """Runs `call()` under the scheduler and returns its result. Calls sharing a `key` while one is in flight reuse its result."""
+        if key is None:
+            return self._run(session_id, call)
+
+        with self._lock:
+            future = self._in_flight.get(key)
+            is_leader = future is None
+            if is_leader:
+                future = Future()
+                self._in_flight[key] = future
+            else:
+                self._coalesced += 1
+
+        if not is_leader:
+            return future.result()
+
+        try:
+            result = self._run(session_id, call)
+        except BaseException as e:
+            with self._lock:
+                self._in_flight.pop(key, None)
+            future.set_exception(e)
+            raise
+
+        with self._lock:
+            self._in_flight.pop(key, None)
+        future.set_result(result)
+        return result
+
+    def stats(self):
+        with self._lock:
+            waits = sorted(self._wait_times)
+            return {
+                "active": self._active,
+                "queue_depth": self._queue_depth,
+                "peak_queue_depth": self._peak_queue_depth,
+                "calls": self._calls,
+                "coalesced": self._coalesced,
+                "rejected": self._rejected,
+                "wait_avg_ms": round(1000 * sum(waits) / len(waits), 2) if waits else 0.0,
+                "wait_p95_ms": round(1000 * waits[int(0.95 * (len(waits) - 1))], 2) if waits else 0.0,
+                "wait_max_ms": round(1000 * waits[-1], 2) if waits else 0.0,
+            }
+
+    def _run(self, session_id, call):
+        try:
+            calls = self._acquire(session_id)
+        except SchedulerBusy as e:
+            print(f"model scheduler busy: {e} stats: {self.stats()}", flush=True)
+            raise
+
+        try:
+            if calls % LOG_STATS_EVERY_N_CALLS == 0:
+                print(f"model scheduler stats: {self.stats()}", flush=True)
+            return call()
+        finally:
+            self._release()
+
+    def _acquire(self, session_id):
+        """Waits for a slot and returns the total number of calls admitted so far."""
+        with self._lock:
+            if self._active < self.max_concurrent and not self._queues:
+                self._active += 1
+                self._calls += 1
+                self._wait_times.append(0.0)
+                return self._calls
+
+            if self._queue_depth >= self.max_queue_depth:
+                self._rejected += 1
+                raise SchedulerBusy(f"Model call queue is full ({self._queue_depth} waiting).")
+
+            ticket = _Ticket(session_id)
+            self._queues.setdefault(session_id, deque()).append(ticket)
+            self._queue_depth += 1
+            self._peak_queue_depth = max(self._peak_queue_depth, self._queue_depth)
+
+        if not ticket.granted.wait(self.queue_timeout):
+            with self._lock:
+                # The slot may have been handed over right as we timed out - in that case just take it
+                if not ticket.granted.is_set():
+                    queue = self._queues[session_id]
+                    queue.remove(ticket)
+                    if not queue:
+                        del self._queues[session_id]
+                    self._queue_depth -= 1
+                    self._rejected += 1
+                    raise SchedulerBusy(f"Waited more than {self.queue_timeout}s for a model call slot.")
+
+        with self._lock:
+            self._calls += 1
+            self._wait_times.append(time.monotonic() - ticket.enqueued_at)
+            return self._calls
+
+    def _release(self):
+        with self._lock:
+            if not self._queues:
+                self._active -= 1
+                return
+
+            # Hand the slot straight to the next session in line, then rotate that session to the back
+            session_id, queue = self._queues.popitem(last=False)
+            ticket = queue.popleft()
+            if queue:
+                self._queues[session_id] = queue
+            self._queue_depth -= 1
+            ticket.granted.set()
+
+
+model_scheduler = ModelCallScheduler()
@@ -0,0 +1,42 @@
+import importlib
+import os
+import threading
+import time
+
+# Heavy modules the chat needs on the first question
+DEFAULT_MODULES = ("dotenv", "agents", "pypdf")
+
+_started = False
+_lock = threading.Lock()
+done = threading.Event()
+
+
+def _prewarm(modules, tasks):
+    start = time.perf_counter()
+    for name in modules:
+        try:
+            importlib.import_module(name)
+        except ImportError as e:
+            print(f"prewarm: could not import {name}: {e}", flush=True)
+    for task in tasks:
+        try:
+            task()
+        except Exception as e:
+            print(f"prewarm: task {getattr(task, '__name__', task)} failed: {e}", flush=True)
+    print(f"prewarm finished in {time.perf_counter() - start:.2f}s", flush=True)
+    done.set()
+
+
+def start_prewarm(modules=DEFAULT_MODULES, tasks=()):
+    """
+    Imports heavy modules and runs warm-up tasks in a background thread, once per process.
+    Set PREWARM=0 to turn it off.
+    """
+    global _started
+    if os.getenv("PREWARM", "1") == "0":
+        return
+    with _lock:
+        if _started:
+            return
+        _started = True
+    threading.Thread(target=_prewarm, args=(modules, tasks), name="prewarm", daemon=True).start()
@@ -0,0 +1,203 @@
+import json
+import math
+import os
+import re
+import threading
+import time
+from collections import Counter, defaultdict
+
+from tools.env import load_env
+
+SAMPLES_PATH = os.path.join(os.path.dirname(__file__), "..", "resume_files", "prompt_filter_samples.jsonl")
+ON_TOPIC = "on_topic"
+DEFAULT_THRESHOLD = 0.9
+LOG_STATS_EVERY_N_CHECKS = 100
+
+# Optional lead-in before a request aimed at the bot: "hey, can you please ..."
+_ASK = r"^(?:(?:hey|hi|ok|okay)[,!]?\s+)?(?:(?:please|can you|could you|would you|will you|i want you to|i need you to)\s+)*"
+
+# Each rule is (pattern, confidence). Patterns only match requests aimed at the bot, so a resume question like
+# "did you create video streaming services?" never hits them. The confidence goes through the same threshold
+# as the classifier, so raising the threshold switches the weaker rules off.
+RULES = {
+    "image": [
+        (_ASK + r"(?:generate|create|make|draw|paint|render|produce|design) (?:me |us )?(?:an? |some |the )?(?:\w+ )?(?:image|picture|photo|drawing|logo|video|illustration|portrait|cartoon|sketch)s?\b", 0.97),
+    ],
+    "browsing": [
+        (_ASK + r"(?:search|browse) (?:the )?(?:web|internet|online)\b", 0.97),
+        (_ASK + r"google (?:it|for|the)\b", 0.95),
+        (_ASK + r"(?:open|visit|go to) (?:this |that |the )?(?:url|link|website|page|https?://)", 0.95),
+        (_ASK + r"look (?:it |this |that )?up online\b", 0.92),
+    ],
+    "medical": [
+        (_ASK + r"diagnose (?:my|this|these|a|the|why my) (?:\w+ )?(?:pain|ache|rash|symptoms?|condition|illness|disease|headache|injury|back|skin|cough|fever|lump)s?\b", 0.95),
+        (r"^what (?:medicine|medication|dose|dosage) (?:should|can|do) i\b", 0.95),
+        (r"^(?:is it safe|should i) (?:to )?(?:take|mix)\b", 0.85),
+    ],
+    "legal": [
+        (_ASK + r"give me (?:some )?legal advice\b", 0.97),
+        (r"^can i sue\b", 0.95),
+        (r"^do i need a lawyer\b", 0.95),
+    ],
+    "financial": [
+        (_ASK + r"give me (?:some )?(?:financial|investment|investing) advice\b", 0.97),
+        (r"^should i (?:buy|sell|invest in) (?:some |more |my )?(?:\w+ )?(?:stocks?|shares|crypto|bitcoin|ethereum|etfs?|bonds|index funds?|options|\$[a-z]{1,5})\b", 0.95),
+        (r"^which (?:stocks?|crypto|coins?) should i\b", 0.95),
+    ],
+    "code_execution": [
+        (_ASK + r"(?:run|execute) (?:this|that|my|these|the following) (?:\w+ )?(?:code|script|snippet|command|program|query|python|bash|javascript|sql)s?\b", 0.97),
+        (_ASK + r"(?:run|execute) (?:an? )?(?:shell|bash|terminal|python|javascript|sql) (?:command|script|query)\b", 0.95),
+        (r"\brm -rf /", 0.97),
+    ],
+    "injection": [
+        (r"\b(?:ignore|disregard|forget) (?:all (?:of )?)?(?:your|all|previous|prior|above|earlier|the previous|the above) (?:previous |prior |earlier )?(?:instructions|prompts?|rules)\b", 0.97),
+        (_ASK + r"(?:reveal|print|show|repeat|tell me) (?:me )?(?:your|the) (?:system prompt|(?:hidden|initial|original|secret) instructions)\b", 0.97),
+        (r"^you are now dan\b", 0.97),
+        (r"^pretend (?:you are|you're|to be) not\b", 0.9),
+    ],
+}
+
+REFUSALS = {
+    "image": "I'd love to, but my artistic talent peaked with stick figures 🎨 I'm here to talk about my career - want to hear about a project I built?",
+    "browsing": "I don't surf the web from here - I'm more of a resume-and-chill kind of agent 🏄 Ask me anything about my background instead!",
+    "medical": "I'm a backend developer, not a doctor - please ask a medical professional 🩺 Happy to talk about my work though!",
+    "legal": "Legal advice is way above my pay grade ⚖️ A lawyer is your best bet. Meanwhile, want to hear about my experience?",
+    "financial": "If I could predict the markets I wouldn't be writing backend code 😄 Please talk to a financial advisor. Anything about my career I can help with?",
+    "code_execution": "Nice try, but I don't run code here 🙂 I'd rather tell you about the code I've written - just ask!",
+    "injection": "I'm staying right here as Ronny 😉 Let's keep it about my career, skills and experience - what would you like to know?",
+}
+
+_TOKEN_RE = re.compile(r"[a-z0-9']+")
+_COMPILED_RULES = {label: [(re.compile(p), confidence) for p, confidence in rules] for label, rules in RULES.items()}
+
+
+def _features(text):
+    words = _TOKEN_RE.findall(text.lower())
+    return words + [f"{a} {b}" for a, b in zip(words, words[1:])]
+
+
+def load_samples(path=SAMPLES_PATH, split=None):
+    samples = []
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                sample = json.loads(line)
+                if split is None or sample["split"] == split:
+                    samples.append(sample)
+    return samples
+
+
+class NgramClassifier:
+    """Tiny multinomial naive Bayes over word unigrams and bigrams."""
+
+    def __init__(self, samples):
+        self.class_counts = Counter(s["label"] for s in samples)
+        self.feature_counts = defaultdict(Counter)
+        for s in samples:
+            self.feature_counts[s["label"]].update(_features(s["text"]))
+        self.vocab_size = len({f for counts in self.feature_counts.values() for f in counts})
+        self.totals = {label: sum(counts.values()) for label, counts in self.feature_counts.items()}
+        total_samples = sum(self.class_counts.values())
+        self.log_priors = {label: math.log(n / total_samples) for label, n in self.class_counts.items()}
+
+    def predict(self, text):
+        """Returns (label, probability) for the most likely class."""
+        features = _features(text)
+        scores = {}
+        for label, log_prior in self.log_priors.items():
+            counts = self.feature_counts[label]
+            denominator = self.totals[label] + self.vocab_size
+            scores[label] = log_prior + sum(math.log((counts[f] + 1) / denominator) for f in features)
+
+        best = max(scores, key=scores.get)
+        norm = sum(math.exp(score - scores[best]) for score in scores.values())
+        return best, 1.0 / norm
+
+
+class PromptFilter:
+    """
+    Cheap local gate in front of the model: regex rules first, then the n-gram classifier.
+    Blocks a prompt only when it's off-topic with confidence >= threshold, and answers it with a canned refusal.
+    """
+
+    def __init__(self, threshold=None, samples_path=SAMPLES_PATH):
+        self._threshold = threshold
+        self.samples_path = samples_path
+        self._classifier = None
+        self._lock = threading.Lock()
+        self.checked = 0
+        self.model_calls_avoided = 0
+        self.blocked_by_label = Counter()
+
+    @property
+    def threshold(self):
+        # Read on first use so a PROMPT_FILTER_THRESHOLD set in .env is honoured
+        if self._threshold is None:
+            load_env()
+            self._threshold = float(os.getenv("PROMPT_FILTER_THRESHOLD", DEFAULT_THRESHOLD))
+        return self._threshold
+
+    @property
+    def classifier(self):
+        if self._classifier is None:
+            self._classifier = NgramClassifier(load_samples(self.samples_path, split="train"))
+        return self._classifier
+
+    def classify(self, text):
+        """Returns (label, confidence) - label is 'on_topic' or the off-topic category."""
+        lowered = " ".join(text.lower().split())
+        for label, rules in _COMPILED_RULES.items():
+            for pattern, confidence in rules:
+                if confidence >= self.threshold and pattern.search(lowered):
+                    return label, confidence
+        return self.classifier.predict(text)
+
+    def check(self, text):
+        """Returns a canned refusal if the prompt should not reach the model, otherwise None."""
+        label, confidence = self.classify(text)
+        blocked = label != ON_TOPIC and confidence >= self.threshold
+        with self._lock:
+            self.checked += 1
+            if blocked:
+                self.model_calls_avoided += 1
+                self.blocked_by_label[label] += 1
+            should_log = self.checked % LOG_STATS_EVERY_N_CHECKS == 0
+        if should_log:
+            print(f"prompt filter stats: {self.stats()}", flush=True)
+        return REFUSALS[label] if blocked else None
+
+    def stats(self):
+        with self._lock:
+            return {
+                "checked": self.checked,
+                "model_calls_avoided": self.model_calls_avoided,
+                "blocked_by_label": dict(self.blocked_by_label),
+            }
+
+    def evaluate(self, split="test"):
+        """Measures blocking precision/recall on the labelled samples, plus the average time per check."""
+        samples = load_samples(self.samples_path, split=split)
+        true_pos = false_pos = false_neg = 0
+        start = time.perf_counter()
+        for s in samples:
+            label, confidence = self.classify(s["text"])
+            predicted_block = label != ON_TOPIC and confidence >= self.threshold
+            actual_block = s["label"] != ON_TOPIC
+            true_pos += predicted_block and actual_block
+            false_pos += predicted_block and not actual_block
+            false_neg += actual_block and not predicted_block
+        elapsed = time.perf_counter() - start
+
+        return {
+            "samples": len(samples),
+            "precision": true_pos / (true_pos + false_pos) if true_pos + false_pos else 1.0,
+            "recall": true_pos / (true_pos + false_neg) if true_pos + false_neg else 1.0,
+            "avg_check_ms": 1000 * elapsed / len(samples) if samples else 0.0,
+        }
+
+
+prompt_filter = PromptFilter()
+
+
+if __name__ == "__main__":
+    print(json.dumps(prompt_filter.evaluate(), indent=2))
@@ -0,0 +1,107 @@
+import json
+import os
+import sqlite3
+import threading
+import time
+
+from tools.env import load_env
+
+# App-owned directory (not the shared temp dir), so other local users can't plant or poison the cache file
+DEFAULT_CACHE_DIR = os.path.join(os.getenv("XDG_CACHE_HOME") or os.path.expanduser("~/.cache"), "ronnykraitman")
+PURGE_EVERY_N_SETS = 100
+LOG_STATS_EVERY_N_LOOKUPS = 100
+
+
+class SharedCache:
+    """
+    Key/value cache shared by all worker processes on the host, backed by SQLite in WAL mode.
+    Values must be JSON-serializable. Every write is a single transaction, so readers in other workers never
+    see a half-written value. Hit/miss counters are kept per process and logged every LOG_STATS_EVERY_N_LOOKUPS.
+    """
+
+    def __init__(self, path=None):
+        self._path = path
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._schema_ready = False
+        self.hits = 0
+        self.misses = 0
+        self._sets = 0
+
+    @property
+    def path(self):
+        # Resolved on first use so a SHARED_CACHE_PATH set in .env is honoured
+        if self._path is None:
+            load_env()
+            self._path = os.getenv("SHARED_CACHE_PATH") or os.path.join(DEFAULT_CACHE_DIR, "shared_cache.sqlite3")
+        return self._path
+
+    def _connection(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), mode=0o700, exist_ok=True)
+            conn = sqlite3.connect(self.path, timeout=10, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            if not self._schema_ready:
+                conn.execute(
+                    "CREATE TABLE IF NOT EXISTS cache (key TEXT PRIMARY KEY, value TEXT NOT NULL, expires_at REAL)"
+                )
+                self._schema_ready = True
+            self._local.conn = conn
+        return conn
+
+    def get(self, key, default=None):
+        row = self._connection().execute(
+            "SELECT value FROM cache WHERE key = ? AND (expires_at IS NULL OR expires_at > ?)",
+            (key, time.time())
+        ).fetchone()
+        with self._lock:
+            if row is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+            should_log = (self.hits + self.misses) % LOG_STATS_EVERY_N_LOOKUPS == 0
+        if should_log:
+            print(f"shared cache stats: {self.stats()}", flush=True)
+        return default if row is None else json.loads(row[0])
+
+    def set(self, key, value, ttl=None):
+        """Stores `value` under `key`. `ttl` is in seconds, None means it never expires."""
+        expires_at = time.time() + ttl if ttl is not None else None
+        conn = self._connection()
+        conn.execute(
+            "INSERT OR REPLACE INTO cache (key, value, expires_at) VALUES (?, ?, ?)",
+            (key, json.dumps(value), expires_at)
+        )
+
+        with self._lock:
+            self._sets += 1
+            should_purge = self._sets % PURGE_EVERY_N_SETS == 0
+        if should_purge:
+            conn.execute("DELETE FROM cache WHERE expires_at IS NOT NULL AND expires_at <= ?", (time.time(),))
+
+    def delete(self, key):
+        self._connection().execute("DELETE FROM cache WHERE key = ?", (key,))
+
+    def get_or_set(self, key, loader, ttl=None):
+        """Returns the cached value for `key`, computing and storing it with `loader()` on a miss."""
+        sentinel = object()
+        value = self.get(key, sentinel)
+        if value is sentinel:
+            value = loader()
+            self.set(key, value, ttl)
+        return value
+
+    def stats(self):
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "pid": os.getpid(),
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0,
+            }
+
+
+shared_cache = SharedCache()